@@ -12,6 +12,7 @@ from .guard import AuraGuard, GuardState
 from .middleware import AgentGuard
 from .async_middleware import AsyncAgentGuard
 from .telemetry import (
+    AsyncWebhookTelemetry,
     CompositeTelemetry,
     InMemoryTelemetry,
     LoggingTelemetry,
@@ -47,5 +48,6 @@ __all__ = [
     "InMemoryTelemetry",
     "WebhookTelemetry",
     "SlackWebhookTelemetry",
+    "AsyncWebhookTelemetry",
     "CompositeTelemetry",
 ]
@@ -7,47 +7,57 @@ Used by CLI: aura-guard demo
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from ..middleware import AgentGuard
 from ..types import PolicyAction
 
 
-def _bad_agent_steps() -> List[Tuple[str, Any]]:
-    """Scripted broken agent: triple refund, jitter search, apology loop."""
-    steps: List[Tuple[str, Any]] = []
+# Enum members are singletons, so the hot loop compares by identity and
+# reuses the pre-extracted values of the actions that end the run.
+_ALLOW = PolicyAction.ALLOW
+_ESC = PolicyAction.ESCALATE
+_FIN = PolicyAction.FINALIZE
+_ESC_V = _ESC.value
+_FIN_V = _FIN.value
+
+_QUERIES: Tuple[str, ...] = (
+    "refund policy", "refund policy EU", "refund policy Germany",
+    "refund policy EU Germany", "refund policy EU Germany 2024",
+    "refund policy EU Germany 2024", "refund policy EU Germany 2024",
+    "refund policy EU Germany 2024",
+)
+
+# Scripted broken agent: triple refund, jitter search, apology loop.
+# Built once at import; the arg dicts are shared and never mutated.
+_STEPS: Tuple[Tuple[str, Any], ...] = (
+    *(("tool", ("refund", {"order_id": "o1", "amount": 10}, "t1")) for _ in range(3)),
+    *(("tool", ("search_kb", {"query": q}, None)) for q in _QUERIES),
+    *(("llm", "I apologize for the inconvenience. We're looking into it.") for _ in range(6)),
+    (
+        "llm",
+        '{"action":"finalize","reason":"ready","reply_draft":"Your refund has been processed.","escalation":null}',
+    ),
+)
 
-    for _ in range(3):
-        steps.append(("tool", ("refund", {"order_id": "o1", "amount": 10}, "t1")))
 
-    queries = [
-        "refund policy", "refund policy EU", "refund policy Germany",
-        "refund policy EU Germany", "refund policy EU Germany 2024",
-        "refund policy EU Germany 2024", "refund policy EU Germany 2024",
-        "refund policy EU Germany 2024",
-    ]
-    for q in queries:
-        steps.append(("tool", ("search_kb", {"query": q}, None)))
+_DEFAULT_RESULT: Dict[str, Any] = {"status": "ok"}
 
-    for _ in range(6):
-        steps.append(("llm", "I apologize for the inconvenience. We're looking into it."))
+_DISPATCH: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "refund": lambda args: {"status": "refunded", **args},
+    "search_kb": lambda args: {"hits": [f"KB:{args.get('query', '')}"]},
+}
 
-    steps.append((
-        "llm",
-        '{"action":"finalize","reason":"ready","reply_draft":"Your refund has been processed.","escalation":null}',
-    ))
-    return steps
+
+def _default_execute(args: Dict[str, Any]) -> Any:
+    return _DEFAULT_RESULT
 
 
 def _mock_execute(name: str, args: Dict[str, Any]) -> Any:
-    if name == "refund":
-        return {"status": "refunded", **args}
-    if name == "search_kb":
-        return {"hits": [f"KB:{args.get('query', '')}"]}
-    return {"status": "ok"}
+    return _DISPATCH.get(name, _default_execute)(args)
 
 
-@dataclass
+@dataclass(slots=True)
 class _Row:
     name: str
     calls: int
@@ -59,73 +69,91 @@ class _Row:
     terminated: Optional[str]
 
 
-def _run_no_guard() -> _Row:
-    executed = side_fx = 0
-    for kind, payload in _bad_agent_steps():
-        if kind == "tool":
-            name, args, _ = payload
-            _mock_execute(name, args)
-            executed += 1
-            if name == "refund":
-                side_fx += 1
-    return _Row("no_guard", executed, side_fx, 0, 0, 0, executed * 0.04, None)
+def _row_dict(r: _Row) -> Dict[str, Any]:
+    return {
+        "variant": r.name,
+        "tool_calls": r.calls,
+        "side_effects": r.side_fx,
+        "blocks": r.blocks,
+        "cache_hits": r.cache,
+        "rewrites": r.rewrites,
+        "cost_usd": round(r.cost, 4),
+        "terminated": r.terminated,
+    }
 
 
-def _run_call_limit(limit: int = 5) -> _Row:
-    executed = side_fx = 0
-    terminated = None
-    for kind, payload in _bad_agent_steps():
-        if kind == "tool":
-            if executed >= limit:
-                terminated = "call_limit"
-                break
-            name, args, _ = payload
-            _mock_execute(name, args)
-            executed += 1
-            if name == "refund":
-                side_fx += 1
-    return _Row(f"call_limit({limit})", executed, side_fx, 0, 0, 0, executed * 0.04, terminated)
-
+def _run_variants(limit: int = 5) -> Tuple[_Row, _Row, _Row]:
+    """Run no_guard, call_limit(limit) and aura_guard in a single pass over _STEPS.
 
-def _run_aura_guard() -> _Row:
+    Each variant keeps its own counters; once a variant terminates it simply
+    stops consuming steps, so results match running the three separately.
+    """
     guard = AgentGuard(
         max_cost_per_run=0.50,
         side_effect_tools={"refund", "send_reply", "cancel"},
         secret_key=b"aura_guard_demo_key",
     )
-    executed = side_fx = 0
-    terminated = None
+    ng_calls = ng_fx = 0
+    cl_calls = cl_fx = 0
+    cl_terminated: Optional[str] = None
+    ag_calls = ag_fx = 0
+    ag_terminated: Optional[str] = None
 
-    for kind, payload in _bad_agent_steps():
-        if terminated:
-            break
+    for kind, payload in _STEPS:
         if kind == "tool":
             name, args, ticket_id = payload
-            d = guard.check_tool(name, args=args, ticket_id=ticket_id)
-            if d.action == PolicyAction.ALLOW:
-                result = _mock_execute(name, args)
-                guard.record_result(ok=True, payload=result)
-                executed += 1
-                if name == "refund":
-                    side_fx += 1
-            elif d.action in (PolicyAction.ESCALATE, PolicyAction.FINALIZE):
-                terminated = d.action.value
-        else:
-            stall = guard.check_output(payload)
-            if stall and stall.action in (PolicyAction.ESCALATE, PolicyAction.FINALIZE):
-                terminated = stall.action.value
+            side_effect = name == "refund"
 
-    return _Row("aura_guard", executed, side_fx, guard.blocks, guard.cache_hits,
-                guard.rewrites, guard.cost_spent, terminated)
+            # no_guard: execute everything.
+            _mock_execute(name, args)
+            ng_calls += 1
+            if side_effect:
+                ng_fx += 1
+
+            # call_limit: execute until the call budget is spent.
+            if cl_terminated is None:
+                if cl_calls >= limit:
+                    cl_terminated = "call_limit"
+                else:
+                    _mock_execute(name, args)
+                    cl_calls += 1
+                    if side_effect:
+                        cl_fx += 1
+
+            # aura_guard: execute only what the guard allows.
+            if ag_terminated is None:
+                action = guard.check_tool(name, args=args, ticket_id=ticket_id).action
+                if action is _ALLOW:
+                    result = _mock_execute(name, args)
+                    guard.record_result(ok=True, payload=result)
+                    ag_calls += 1
+                    if side_effect:
+                        ag_fx += 1
+                elif action is _ESC:
+                    ag_terminated = _ESC_V
+                elif action is _FIN:
+                    ag_terminated = _FIN_V
+        elif ag_terminated is None:
+            stall = guard.check_output(payload)
+            if stall is not None:
+                if stall.action is _ESC:
+                    ag_terminated = _ESC_V
+                elif stall.action is _FIN:
+                    ag_terminated = _FIN_V
+
+    return (
+        _Row("no_guard", ng_calls, ng_fx, 0, 0, 0, ng_calls * 0.04, None),
+        _Row(f"call_limit({limit})", cl_calls, cl_fx, 0, 0, 0, cl_calls * 0.04, cl_terminated),
+        _Row("aura_guard", ag_calls, ag_fx, guard.blocks, guard.cache_hits,
+             guard.rewrites, guard.cost_spent, ag_terminated),
+    )
 
 
 def run_demo(json_out: Optional[str] = None) -> None:
     """Run the triage simulation demo and print results."""
     import datetime
 
-    a = _run_no_guard()
-    b = _run_call_limit(5)
-    c = _run_aura_guard()
+    a, b, c = _run_variants(5)
 
     print()
     print("=" * 64)
@@ -154,18 +182,6 @@ def run_demo(json_out: Optional[str] = None) -> None:
     if json_out:
         from .. import __version__
 
-        def _row_dict(r: _Row) -> Dict[str, Any]:
-            return {
-                "variant": r.name,
-                "tool_calls": r.calls,
-                "side_effects": r.side_fx,
-                "blocks": r.blocks,
-                "cache_hits": r.cache,
-                "rewrites": r.rewrites,
-                "cost_usd": round(r.cost, 4),
-                "terminated": r.terminated,
-            }
-
         report = {
             "type": "aura_guard_demo",
             "version": __version__,
@@ -185,7 +201,8 @@ def run_demo(json_out: Optional[str] = None) -> None:
         }
 
         import json as json_mod
+        text = json_mod.dumps(report, indent=2)
         with open(json_out, "w") as f:
-            json_mod.dump(report, f, indent=2)
+            f.write(text)
         print(f"  JSON report saved to: {json_out}")
         print()
@@ -59,27 +59,34 @@ def _stable_json_dumps(obj: Any) -> str:
     return json.dumps(_canonicalize(obj), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
-def _hmac_hex(secret_key: bytes, message: str) -> str:
-    return hmac.new(secret_key, message.encode("utf-8"), sha256).hexdigest()
+def _keyed_hmac(secret_key: bytes) -> "hmac.HMAC":
+    """Pre-keyed HMAC template; copying it skips re-deriving the inner/outer pads."""
+    return hmac.new(bytes(secret_key), digestmod=sha256)
 
 
-def _args_sig(cfg: AuraGuardConfig, args: Dict[str, Any], tool_name: str = "") -> str:
+def _hmac_hex(key: "hmac.HMAC", message: str) -> str:
+    h = key.copy()
+    h.update(message.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _args_sig(cfg: AuraGuardConfig, key: "hmac.HMAC", args: Dict[str, Any], tool_name: str = "") -> str:
     filtered = args
     if tool_name:
         ignore = cfg.get_arg_ignore_keys(tool_name)
         if ignore:
             filtered = {k: v for k, v in args.items() if k not in ignore}
-    return _hmac_hex(cfg.secret_key, "args:" + _stable_json_dumps(filtered))
+    return _hmac_hex(key, "args:" + _stable_json_dumps(filtered))
 
 
-def _ticket_sig(cfg: AuraGuardConfig, ticket_id: Optional[str], fallback_run_id: str) -> str:
+def _ticket_sig(key: "hmac.HMAC", ticket_id: Optional[str], fallback_run_id: str) -> str:
     if ticket_id:
-        return _hmac_hex(cfg.secret_key, "ticket:" + str(ticket_id))
-    return _hmac_hex(cfg.secret_key, "run:" + fallback_run_id)
+        return _hmac_hex(key, "ticket:" + str(ticket_id))
+    return _hmac_hex(key, "run:" + fallback_run_id)
 
 
-def _payload_sig(cfg: AuraGuardConfig, payload: Any) -> str:
-    return _hmac_hex(cfg.secret_key, "payload:" + _stable_json_dumps(payload))
+def _payload_sig(key: "hmac.HMAC", payload: Any) -> str:
+    return _hmac_hex(key, "payload:" + _stable_json_dumps(payload))
 
 
 def _now() -> float:
@@ -134,10 +141,10 @@ def _tokenize(text: str) -> List[str]:
     return _TOKEN_RE.findall(text.lower())
 
 
-def _token_sig_set(cfg: AuraGuardConfig, text: str) -> Set[str]:
+def _token_sig_set(key: "hmac.HMAC", text: str) -> Set[str]:
     """Compute HMAC-signed token set for similarity without storing raw text."""
     toks = _tokenize(text)
-    return {_hmac_hex(cfg.secret_key, "tok:" + t) for t in toks}
+    return {_hmac_hex(key, "tok:" + t) for t in toks}
 
 
 def _overlap_similarity(a: Set[str], b: Set[str]) -> float:
@@ -257,6 +264,8 @@ class AuraGuard:
     ):
         self.cfg = config or AuraGuardConfig()
         self.telemetry = telemetry
+        self._keyed: Optional["hmac.HMAC"] = None
+        self._keyed_for: Optional[bytes] = None
 
         if self.cfg.secret_key == b"aura-guard-dev-key-CHANGE-ME":
             warnings.warn(
@@ -270,6 +279,20 @@ class AuraGuard:
     # Internal helpers
     # -------------------------
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # HMAC objects cannot be pickled; the template is rebuilt lazily.
+        state = self.__dict__.copy()
+        state["_keyed"] = None
+        state["_keyed_for"] = None
+        return state
+
+    def _hmac_key(self) -> "hmac.HMAC":
+        """Keyed HMAC template for cfg.secret_key, rebuilt if the key is replaced."""
+        if self._keyed is None or self._keyed_for is not self.cfg.secret_key:
+            self._keyed = _keyed_hmac(self.cfg.secret_key)
+            self._keyed_for = self.cfg.secret_key
+        return self._keyed
+
     def _emit(self, event: str, *, state: Optional[GuardState] = None, **fields: Any) -> None:
         if not self.telemetry:
             return
@@ -408,8 +431,8 @@ class AuraGuard:
         tool = call.name
         is_side_effect = self.cfg.is_side_effect_tool(tool, call.side_effect)
 
-        args_sig = _args_sig(self.cfg, call.args, tool_name=tool)
-        t_sig = _ticket_sig(self.cfg, call.ticket_id, state.run_id)
+        args_sig = _args_sig(self.cfg, self._hmac_key(), call.args, tool_name=tool)
+        t_sig = _ticket_sig(self._hmac_key(), call.ticket_id, state.run_id)
 
         sig = ToolCallSig(name=tool, args_sig=args_sig, ticket_sig=t_sig, side_effect=is_side_effect)
 
@@ -622,7 +645,7 @@ class AuraGuard:
 
             # Set deterministic idempotency key
             call.idempotency_key = _hmac_hex(
-                self.cfg.secret_key, f"idem:{t_sig}:{tool}:{args_sig}"
+                self._hmac_key(), f"idem:{t_sig}:{tool}:{args_sig}"
             )[:32]
 
         # ──────────────────────────────────────────
@@ -653,7 +676,7 @@ class AuraGuard:
                 break
 
         if q_val is not None:
-            q_sig_set = _token_sig_set(self.cfg, q_val)
+            q_sig_set = _token_sig_set(self._hmac_key(), q_val)
             hist = state.tool_query_sigs.setdefault(tool, [])
 
             similar = sum(
@@ -735,12 +758,12 @@ class AuraGuard:
         tool = call.name
         side_effect = self.cfg.is_side_effect_tool(tool, call.side_effect)
 
-        args_sig = _args_sig(self.cfg, call.args, tool_name=tool)
-        t_sig = _ticket_sig(self.cfg, call.ticket_id, state.run_id)
+        args_sig = _args_sig(self.cfg, self._hmac_key(), call.args, tool_name=tool)
+        t_sig = _ticket_sig(self._hmac_key(), call.ticket_id, state.run_id)
 
         # Fill payload signature if missing
         if result.payload_sig is None and result.payload is not None:
-            result.payload_sig = _payload_sig(self.cfg, result.payload)
+            result.payload_sig = _payload_sig(self._hmac_key(), result.payload)
 
         # Infer side_effect_executed when possible
         if result.side_effect_executed is None:
@@ -850,13 +873,13 @@ class AuraGuard:
             state.last_progress_marker = cur_marker
             state.stall_streak = 0
             state.stall_pattern_streak = 0
-            state.last_assistant_token_sigs = _token_sig_set(self.cfg, text)
+            state.last_assistant_token_sigs = _token_sig_set(self._hmac_key(), text)
             return None
 
         # No new tool progress. Check both signals.
 
         # Signal A: Token overlap similarity
-        cur_tokens = _token_sig_set(self.cfg, text)
+        cur_tokens = _token_sig_set(self._hmac_key(), text)
         prev_tokens = state.last_assistant_token_sigs
 
         if prev_tokens is None:
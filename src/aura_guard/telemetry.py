@@ -14,12 +14,33 @@ Security:
 
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import logging
-import urllib.request
+import queue
+import threading
+import time
+import weakref
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Protocol
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Deque, Dict, Hashable, Iterable, List, Mapping, Optional, Protocol, Set, Tuple
+
+# http.client (which drags in ssl and email) and datetime are imported lazily
+# by the sinks that need them, so `import aura_guard` does not pay for them.
+if TYPE_CHECKING:
+    import http.client
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
 
 
 # ================================
@@ -36,74 +57,465 @@ class TelemetrySink(Protocol):
 # Built-in Sinks
 # ================================
 
-@dataclass
+@dataclass(slots=True)
 class LoggingTelemetry:
     """Default telemetry sink using Python logging."""
 
     logger_name: str = "aura_guard"
     level: int = logging.INFO
 
+    _logger: logging.Logger = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(self.logger_name)
+
     def emit(self, event: Dict[str, Any]) -> None:
-        logging.getLogger(self.logger_name).log(self.level, "%s", event)
+        if self._logger.isEnabledFor(self.level):
+            self._logger.log(self.level, "%s", event)
+
+
+class _EventSnapshot(list):
+    """List snapshot of InMemoryTelemetry.events that refuses in-place mutation.
+
+    Mutating a copy would silently leave the sink unchanged, so every
+    mutator raises instead; the snapshot still compares equal to a list.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(
+            "InMemoryTelemetry.events is a read-only snapshot; "
+            "record with emit() and reset with clear()"
+        )
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
 
 
-@dataclass
 class InMemoryTelemetry:
-    """Stores events in-memory. Useful for tests, benchmarks, and harnesses."""
+    """Stores events in-memory. Useful for tests, benchmarks, and harnesses.
+
+    Keeps at most `max_events` of the most recent events (None = unbounded);
+    older events are evicted from `events`, `find()` and `cost_saved` alike.
+    Record events through `emit()` and reset with `clear()`; `events` is a
+    read-only snapshot.
+    """
 
-    events: List[Dict[str, Any]] = field(default_factory=list)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        events: Optional[Iterable[Dict[str, Any]]] = None,
+        max_events: Optional[int] = 10_000,
+    ):
+        if max_events is not None and max_events < 1:
+            raise ValueError("max_events must be >= 1 (or None for unbounded)")
+        self.max_events = max_events
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._by_name: Dict[str, Deque[Dict[str, Any]]] = {}
+        # One slot per retained event: its cost as float, or None when absent/non-numeric.
+        self._costs: Deque[Optional[float]] = deque()
+        self._cost_count = 0
+        self._cost_sum = 0.0
+        for e in events or ():
+            self.emit(e)
+
+    def __repr__(self) -> str:
+        return f"InMemoryTelemetry(events={list(self._events)!r}, max_events={self.max_events!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.max_events, list(self._events)) == (other.max_events, list(other._events))  # type: ignore[attr-defined]
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Retained events, oldest first, as a read-only snapshot (mutators raise TypeError)."""
+        return _EventSnapshot(self._events)
 
     def emit(self, event: Dict[str, Any]) -> None:
-        self.events.append(event)
+        events = self._events
+        if len(events) == events.maxlen:
+            self._forget(events[0])
+        events.append(event)
+        name = event.get("event")
+        bucket = self._by_name.get(name)
+        if bucket is None:
+            bucket = self._by_name[name] = deque()
+        bucket.append(event)
+        cost: Optional[float] = None
+        v = event.get("estimated_cost_avoided")
+        if v is not None:
+            try:
+                cost = float(v)
+            except (TypeError, ValueError):
+                pass  # keep the event; a value that is not a number just adds no cost
+        self._costs.append(cost)
+        if cost is not None:
+            self._cost_count += 1
+            self._cost_sum += cost
+
+    def _forget(self, oldest: Dict[str, Any]) -> None:
+        # The oldest event overall is also the oldest in its name bucket.
+        name = oldest.get("event")
+        bucket = self._by_name[name]
+        bucket.popleft()
+        if not bucket:
+            del self._by_name[name]
+        cost = self._costs.popleft()
+        if cost is not None:
+            self._cost_count -= 1
+            # Reset instead of subtracting the last value so rounding drift cannot linger.
+            self._cost_sum = self._cost_sum - cost if self._cost_count else 0.0
 
     def clear(self) -> None:
-        self.events.clear()
+        self._events.clear()
+        self._by_name.clear()
+        self._costs.clear()
+        self._cost_count = 0
+        self._cost_sum = 0.0
 
     def find(self, event_name: str) -> List[Dict[str, Any]]:
         """Return all events matching the given event name."""
-        return [e for e in self.events if e.get("event") == event_name]
+        return list(self._by_name.get(event_name, ()))
 
     @property
     def cost_saved(self) -> float:
         """Sum of all estimated_cost_avoided values across events."""
-        total = 0.0
-        for e in self.events:
-            v = e.get("estimated_cost_avoided")
-            if v is not None:
-                total += float(v)
-        return total
+        return self._cost_sum
+
+    @property
+    def costs(self) -> "array[float]":
+        """Numeric estimated_cost_avoided values in emit order, as a contiguous float64 buffer.
+
+        Supports the buffer protocol, so audits can `numpy.asarray(sink.costs)`
+        or `math.fsum(sink.costs)` for an exact re-sum of `cost_saved`.
+        """
+        return array("d", [c for c in self._costs if c is not None])
+
+
+# ================================
+# Background Webhook Delivery
+# ================================
+
+_ts_cache = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """ISO-8601 UTC timestamp at one-second resolution, formatted once per second."""
+    global _ts_cache
+    now = int(time.time())
+    if _ts_cache[0] != now:
+        from datetime import datetime, timezone
+
+        _ts_cache = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+    return _ts_cache[1]
+
+
+_MAX_RETRIES = 3
+_BACKOFF_BASE_SECONDS = 0.1
+_STOP = object()  # queue sentinel: send what is pending, then exit the worker
+# Guards the rare worker start/stop on webhook sinks; module-level so the
+# sinks themselves stay copyable and picklable.
+_WORKER_LOCK = threading.Lock()
+
+
+def _parse_webhook_url(url: str) -> Tuple[str, str, Optional[int], str]:
+    """Split a webhook URL into (scheme, host, port, request path)."""
+    import urllib.parse
+
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"Unsupported webhook URL: {url!r}")
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    return parts.scheme, parts.hostname, parts.port, path
+
+
+class _WebhookWorker:
+    """Daemon thread that drains a bounded queue and POSTs events in batches.
+
+    The guard only ever pays for a `put_nowait` — when the queue is full the
+    event is dropped. Batches are flushed when `batch_size` events accumulate
+    or `flush_interval` seconds after the first event of the batch, over a
+    single keep-alive connection. A connection the server closed while idle
+    is re-opened immediately; other socket or protocol errors are retried
+    with exponential backoff.
+
+    The worker never references its sink (so the sink can be garbage
+    collected); `close()` stops it, and is also run at interpreter exit to
+    drain whatever is still queued.
+    """
+
+    def __init__(
+        self,
+        target: Tuple[str, str, Optional[int], str],
+        *,
+        encode_batch: Callable[[List[Any]], bytes],
+        headers: Dict[str, str],
+        timeout_seconds: float,
+        batch_size: int,
+        flush_interval: float,
+        max_queue_size: int,
+    ):
+        self._scheme, self._host, self._port, self._path = target
+        self._encode_batch = encode_batch
+        self._headers = headers
+        self._timeout = timeout_seconds
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+        self.dropped = 0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="aura-guard-webhook", daemon=True,
+        )
+        self._thread.start()
+        atexit.register(self.close, timeout_seconds)
+
+    def submit(self, item: Any) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far has been sent (or dropped)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Send everything queued so far, then stop the worker thread.
+
+        Waits at most `timeout` seconds (None = until done). Idempotent.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    # -------------------------
+    # Worker thread
+    # -------------------------
+
+    def _run(self) -> None:
+        batch: List[Any] = []
+        waiters: List[threading.Event] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # flush interval elapsed
+
+            stop = item is _STOP
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item is not None and not stop:
+                if not batch:
+                    deadline = time.monotonic() + self._flush_interval
+                batch.append(item)
+                if len(batch) < self._batch_size:
+                    continue
+
+            if batch:
+                try:
+                    body = self._encode(batch)
+                    if body is not None:
+                        self._send(body)
+                except Exception:
+                    pass  # telemetry must never break the guard (or its worker)
+                batch = []
+            for w in waiters:
+                w.set()
+            waiters.clear()
+            if stop:
+                self._close()
+                return
+
+    def _encode(self, batch: List[Any]) -> Optional[bytes]:
+        try:
+            return self._encode_batch(batch)
+        except Exception:
+            pass
+        # A malformed event must cost only itself, not the whole batch.
+        good = []
+        for item in batch:
+            try:
+                self._encode_batch([item])
+            except Exception:
+                self.dropped += 1
+            else:
+                good.append(item)
+        return self._encode_batch(good) if good else None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            import http.client
+
+            cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            self._conn = cls(self._host, self._port, timeout=self._timeout)
+        return self._conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _send(self, body: bytes) -> None:
+        import http.client
+
+        stale_errors = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+        attempt = 0
+        while True:
+            reused = self._conn is not None
+            try:
+                conn = self._connection()
+                conn.request("POST", self._path, body=body, headers=self._headers)
+                conn.getresponse().read()
+                return
+            except (http.client.HTTPException, OSError) as exc:
+                self._close()
+                if reused and isinstance(exc, stale_errors):
+                    continue  # server closed the idle keep-alive socket; reconnect now
+                if attempt == _MAX_RETRIES:
+                    return
+                time.sleep(_BACKOFF_BASE_SECONDS * (2 ** attempt))
+                attempt += 1
+
+
+def _default_dedup_key(event: Dict[str, Any]) -> Hashable:
+    return (event.get("event"), event.get("tool"))
+
+
+def _coalesce(
+    events: List[Dict[str, Any]], dedup_key: Callable[[Dict[str, Any]], Hashable],
+) -> List[Dict[str, Any]]:
+    """Merge events sharing a dedup key into the first one, adding `occurrences`.
+
+    The merge counter has its own key so event fields such as the guard's
+    `count` pass through untouched. Numeric `estimated_cost_avoided` values are
+    summed across the merged events so cost totals survive coalescing. Output keeps
+    first-seen order.
+    """
+    merged: Dict[Hashable, Dict[str, Any]] = {}
+    for e in events:
+        key = dedup_key(e)
+        first = merged.get(key)
+        if first is None:
+            merged[key] = {**e, "occurrences": 1}
+            continue
+        first["occurrences"] += 1
+        cost = e.get("estimated_cost_avoided")
+        total = first.get("estimated_cost_avoided")
+        if total is None:
+            total = 0.0
+        # Only sum real numbers; anything else (strings, bools) keeps the first value.
+        if _is_number(cost) and _is_number(total):
+            first["estimated_cost_avoided"] = total + cost
+    return list(merged.values())
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
 
 
 @dataclass
 class WebhookTelemetry:
     """Send guard events to an HTTP webhook (Slack, PagerDuty, custom dashboard).
 
-    Events are fire-and-forget with a short timeout.
+    Events are queued and delivered by a background thread in batches: each
+    POST body is a JSON array of up to `batch_size` events.
+    With `coalesce=True`, events in a batch that share `dedup_key(event)`
+    (default: event name and tool) are merged into one entry with an
+    `occurrences` counter, and the body becomes `{"events": [...]}`.
     Failed deliveries are silently dropped (guard must not block on telemetry).
+    Queued events are drained at interpreter exit; `close()` stops the
+    background thread earlier.
     """
 
     url: str
     timeout_seconds: float = 2.0
     auth_header: Optional[str] = None          # e.g., "Bearer sk-..."
     include_timestamp: bool = True
+    batch_size: int = 100
+    flush_interval: float = 0.5                # seconds
+    max_queue_size: int = 1024
+    coalesce: bool = False
+    dedup_key: Callable[[Dict[str, Any]], Hashable] = field(default=_default_dedup_key, repr=False)
+
+    _target: Tuple[str, str, Optional[int], str] = field(init=False, repr=False, compare=False)
+    _worker: Optional[_WebhookWorker] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._target = _parse_webhook_url(self.url)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies and unpickled sinks start their own worker on first emit.
+        return {**self.__dict__, "_worker": None}
 
     def emit(self, event: Dict[str, Any]) -> None:
         payload = dict(event)
         if self.include_timestamp:
-            payload["timestamp"] = datetime.now(timezone.utc).isoformat()
-
-        headers: Dict[str, str] = {"Content-Type": "application/json"}
-        if self.auth_header:
-            headers["Authorization"] = self.auth_header
-
-        body = json.dumps(payload, default=str).encode("utf-8")
-        req = urllib.request.Request(
-            self.url, data=body, headers=headers, method="POST",
-        )
-        try:
-            urllib.request.urlopen(req, timeout=self.timeout_seconds)
-        except Exception:
-            pass  # fire and forget — telemetry must never break the guard
+            payload["timestamp"] = _utc_timestamp()
+        (self._worker or self._start_worker()).submit(payload)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued events to be delivered. Returns False on timeout."""
+        return self._worker.flush(timeout) if self._worker else True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Deliver queued events and stop the background thread."""
+        with _WORKER_LOCK:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.close(timeout)
+
+    def _start_worker(self) -> _WebhookWorker:
+        with _WORKER_LOCK:
+            if self._worker is None:
+                headers: Dict[str, str] = {"Content-Type": "application/json"}
+                if self.auth_header:
+                    headers["Authorization"] = self.auth_header
+                self._worker = _WebhookWorker(
+                    self._target,
+                    encode_batch=functools.partial(
+                        _encode_webhook_batch, coalesce=self.coalesce, dedup_key=self.dedup_key,
+                    ),
+                    headers=headers,
+                    timeout_seconds=self.timeout_seconds,
+                    batch_size=self.batch_size,
+                    flush_interval=self.flush_interval,
+                    max_queue_size=self.max_queue_size,
+                )
+                # Stop the thread without waiting once the sink is collected.
+                weakref.finalize(self, self._worker.close, 0).atexit = False
+            return self._worker
+
+
+def _encode_webhook_batch(
+    events: List[Dict[str, Any]], *, coalesce: bool, dedup_key: Callable[[Dict[str, Any]], Hashable],
+) -> bytes:
+    if coalesce:
+        return _dumps({"events": _coalesce(events, dedup_key)})
+    return _dumps(events)
+
+
+_SLACK_TEXT_PREFIX = b'{"text":'
 
 
 @dataclass
@@ -111,13 +523,23 @@ class SlackWebhookTelemetry:
     """Format guard events as Slack messages and send via incoming webhook.
 
     Formats events into human-readable Slack messages with emoji indicators.
+    Events queued within `flush_interval` are posted as a single message;
+    with `coalesce=True`, repeats of the same `dedup_key(event)` in that
+    message are collapsed into one entry with an occurrence count.
+    Queued messages are drained at interpreter exit; `close()` stops the
+    background thread earlier.
     """
 
     webhook_url: str
     channel: Optional[str] = None
     timeout_seconds: float = 2.0
+    batch_size: int = 20
+    flush_interval: float = 0.5                # seconds
+    max_queue_size: int = 1024
+    coalesce: bool = False
+    dedup_key: Callable[[Dict[str, Any]], Hashable] = field(default=_default_dedup_key, repr=False)
 
-    _EMOJI_MAP: Dict[str, str] = field(default_factory=lambda: {
+    _EMOJI_MAP: ClassVar[Mapping[str, str]] = MappingProxyType({
         "tool_call_cache_hit": "🔄",
         "identical_toolcall_loop_block": "🛑",
         "arg_jitter_loop_quarantine": "🔒",
@@ -129,38 +551,186 @@ class SlackWebhookTelemetry:
         "budget_exceeded_escalate": "🚨",
         "stall_forced_rewrite": "🌀",
         "stall_deterministic_escalate": "⏹️",
-    }, repr=False)
+    })
+
+    _target: Tuple[str, str, Optional[int], str] = field(init=False, repr=False, compare=False)
+    _body_suffix: bytes = field(init=False, repr=False, compare=False)
+    _worker: Optional[_WebhookWorker] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._target = _parse_webhook_url(self.webhook_url)
+        # The channel is fixed per sink, so its JSON fragment is encoded once.
+        self._body_suffix = (b',"channel":' + _dumps(self.channel) + b"}") if self.channel else b"}"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies and unpickled sinks start their own worker on first emit.
+        return {**self.__dict__, "_worker": None}
 
     def emit(self, event: Dict[str, Any]) -> None:
+        (self._worker or self._start_worker()).submit(event)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued messages to be delivered. Returns False on timeout."""
+        return self._worker.flush(timeout) if self._worker else True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Deliver queued messages and stop the background thread."""
+        with _WORKER_LOCK:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.close(timeout)
+
+    def _start_worker(self) -> _WebhookWorker:
+        with _WORKER_LOCK:
+            if self._worker is None:
+                self._worker = _WebhookWorker(
+                    self._target,
+                    encode_batch=functools.partial(
+                        type(self)._encode_messages,
+                        body_suffix=self._body_suffix,
+                        coalesce=self.coalesce,
+                        dedup_key=self.dedup_key,
+                    ),
+                    headers={"Content-Type": "application/json"},
+                    timeout_seconds=self.timeout_seconds,
+                    batch_size=self.batch_size,
+                    flush_interval=self.flush_interval,
+                    max_queue_size=self.max_queue_size,
+                )
+                # Stop the thread without waiting once the sink is collected.
+                weakref.finalize(self, self._worker.close, 0).atexit = False
+            return self._worker
+
+    @classmethod
+    def _format(cls, event: Dict[str, Any]) -> str:
         event_name = event.get("event", "unknown")
-        emoji = self._EMOJI_MAP.get(event_name, "🛡️")
+        emoji = cls._EMOJI_MAP.get(event_name, "🛡️")
         tool = event.get("tool", "")
         reason = event.get("reason", event_name)
         cost = event.get("estimated_cost_avoided")
-
-        lines = [f"{emoji} *Aura Guard* — `{event_name}`"]
-        if tool:
-            lines.append(f"Tool: `{tool}`")
-        if reason and reason != event_name:
-            lines.append(f"Reason: {reason}")
-        if cost is not None:
-            lines.append(f"Cost avoided: ${cost:.4f}")
-
-        text = "\n".join(lines)
-        payload: Dict[str, Any] = {"text": text}
-        if self.channel:
-            payload["channel"] = self.channel
-
-        body = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            self.webhook_url, data=body,
-            headers={"Content-Type": "application/json"},
-            method="POST",
+        occurrences = event.get("occurrences", 1)
+
+        return (
+            f"{emoji} *Aura Guard* — `{event_name}`"
+            + (f" ×{occurrences}" if occurrences > 1 else "")
+            + (f"\nTool: `{tool}`" if tool else "")
+            + (f"\nReason: {reason}" if reason and reason != event_name else "")
+            + (f"\nCost avoided: ${cost:.4f}" if cost is not None else "")
         )
+
+    @classmethod
+    def _encode_messages(
+        cls,
+        events: List[Dict[str, Any]],
+        *,
+        body_suffix: bytes,
+        coalesce: bool,
+        dedup_key: Callable[[Dict[str, Any]], Hashable],
+    ) -> bytes:
+        # A classmethod, so the background worker holds no reference to the sink.
+        if coalesce:
+            events = _coalesce(events, dedup_key)
+        text = "\n\n".join([cls._format(e) for e in events])
+        return _SLACK_TEXT_PREFIX + _dumps(text) + body_suffix
+
+
+@dataclass
+class AsyncWebhookTelemetry:
+    """Send guard events to an HTTP webhook from inside a running event loop.
+
+    Intended for `AsyncAgentGuard`: each event is POSTed by a fire-and-forget
+    task on a shared `httpx.AsyncClient` (HTTP/2 when `h2` is installed), so
+    concurrent deliveries are multiplexed over one connection. Events emitted
+    with no running loop are dropped. Call `aclose()` when the loop shuts down.
+
+    Requires: pip install aura-guard[httpx]
+    """
+
+    url: str
+    timeout_seconds: float = 2.0
+    auth_header: Optional[str] = None          # e.g., "Bearer sk-..."
+    include_timestamp: bool = True
+    http2: bool = True
+
+    _client: Any = field(default=None, init=False, repr=False, compare=False)
+    _loop: Any = field(default=None, init=False, repr=False, compare=False)
+    _tasks: Set[Any] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        _parse_webhook_url(self.url)
+        try:
+            import httpx  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                "AsyncWebhookTelemetry requires httpx: pip install aura-guard[httpx]"
+            ) from exc
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        import asyncio
+
         try:
-            urllib.request.urlopen(req, timeout=self.timeout_seconds)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logging.getLogger("aura_guard").debug("AsyncWebhookTelemetry: no running loop, event dropped")
+            return
+
+        payload = dict(event)
+        if self.include_timestamp:
+            payload["timestamp"] = _utc_timestamp()
+        task = loop.create_task(self._post(_dumps(payload)))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+
+    async def aclose(self) -> None:
+        """Wait for in-flight deliveries and close the HTTP client."""
+        import asyncio
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = self._loop = None
+
+    def _get_client(self, loop: Any) -> Any:
+        # An AsyncClient is bound to the loop it was first used on.
+        if self._client is None or self._loop is not loop:
+            import httpx
+
+            if self._client is not None:
+                # Release the previous loop's client (and its sockets) before replacing it.
+                task = loop.create_task(self._close_quietly(self._client))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            try:
+                self._client = httpx.AsyncClient(http2=self.http2, timeout=self.timeout_seconds)
+            except ImportError:  # http2=True without the h2 package
+                self._client = httpx.AsyncClient(timeout=self.timeout_seconds)
+            self._loop = loop
+        return self._client
+
+    @staticmethod
+    async def _close_quietly(client: Any) -> None:
+        try:
+            await client.aclose()
         except Exception:
-            pass
+            # Its loop may already be closed; the client is still marked closed.
+            logging.getLogger("aura_guard").debug("AsyncWebhookTelemetry: error closing stale client", exc_info=True)
+
+    async def _post(self, body: bytes) -> None:
+        import asyncio
+
+        headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if self.auth_header:
+            headers["Authorization"] = self.auth_header
+        client = self._get_client(asyncio.get_running_loop())
+        await client.post(self.url, content=body, headers=headers)
+
+    def _on_done(self, task: Any) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.getLogger("aura_guard").debug(
+                "AsyncWebhookTelemetry delivery failed", exc_info=task.exception(),
+            )
 
 
 @dataclass
@@ -168,9 +738,13 @@ class CompositeTelemetry:
     """Fan-out to multiple sinks (e.g., logging + webhook + Langfuse)."""
 
     sinks: List[Any] = field(default_factory=list)  # List[TelemetrySink]
+    disabled: bool = False                          # drop every event without fan-out
 
     def emit(self, event: Dict[str, Any]) -> None:
-        for sink in self.sinks:
+        sinks = self.sinks
+        if self.disabled or not sinks:
+            return
+        for sink in sinks:
             try:
                 sink.emit(event)
             except Exception:
@@ -185,7 +759,7 @@ class CompositeTelemetry:
 # Telemetry Facade
 # ================================
 
-@dataclass
+@dataclass(slots=True)
 class Telemetry:
     """Thin facade that the guard uses.
 
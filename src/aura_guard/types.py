@@ -40,7 +40,7 @@ class PolicyAction(str, Enum):
 # Tool Call / Result
 # ================================
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """A structured tool call request.
 
@@ -60,7 +60,7 @@ class ToolCall:
     idempotency_key: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """A structured tool result.
 
@@ -85,7 +85,7 @@ class ToolResult:
 # Internal Signatures (PII-safe)
 # ================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCallSig:
     """Safe signature representation of a tool call.
 
@@ -102,7 +102,7 @@ class ToolCallSig:
 # Policy Decision
 # ================================
 
-@dataclass
+@dataclass(slots=True)
 class PolicyDecision:
     """Return value of Aura Guard decision methods."""
 
@@ -124,7 +124,7 @@ class PolicyDecision:
 # Cost Event
 # ================================
 
-@dataclass
+@dataclass(slots=True)
 class CostEvent:
     """A single cost tracking event."""
 
@@ -4,7 +4,10 @@ Tests for Aura Guard core engine — enforcement primitives and policy layer.
 """
 
 import json
+import logging
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -22,7 +25,16 @@ from aura_guard import (
     ToolCall,
     ToolResult,
 )
-from aura_guard.telemetry import InMemoryTelemetry, Telemetry
+from aura_guard.telemetry import (
+    CompositeTelemetry,
+    InMemoryTelemetry,
+    LoggingTelemetry,
+    SlackWebhookTelemetry,
+    Telemetry,
+    WebhookTelemetry,
+    _default_dedup_key,
+    _encode_webhook_batch,
+)
 
 
 # ─────────────────────────────────────
@@ -53,6 +65,37 @@ def state(guard):
     return guard.new_state(run_id="test-run")
 
 
+@pytest.fixture
+def webhook_server(request):
+    """Local HTTP server that records every POST body it receives.
+
+    Parametrize indirectly with True to drop the connection after each
+    response without announcing it (a stale keep-alive socket).
+    """
+    bodies = []
+    drop_connections = getattr(request, "param", False)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            bodies.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            self.close_connection = drop_connections
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/hook", bodies
+    server.shutdown()
+    server.server_close()
+
+
 # ─────────────────────────────────────
 # Primitive 1: Identical tool-call repeat
 # ─────────────────────────────────────
@@ -393,6 +436,20 @@ class TestAgentGuard:
 # ─────────────────────────────────────
 
 class TestSerialization:
+    def test_state_deepcopy_and_pickle(self, guard, state):
+        import copy
+        import pickle
+
+        call = ToolCall(name="search_kb", args={"query": "test"})
+        guard.on_tool_call_request(state=state, call=call)
+        guard.on_tool_result(state=state, call=call, result=ToolResult(ok=True))
+        assert state.tool_stream
+
+        sig = state.tool_stream[0]
+        assert copy.deepcopy(sig) == sig
+        assert pickle.loads(pickle.dumps(sig)) == sig
+        assert copy.deepcopy(state).tool_stream == state.tool_stream
+
     def test_roundtrip(self, guard, state):
         from aura_guard.serialization import state_to_json, state_from_json
 
@@ -536,6 +593,257 @@ class TestTelemetry:
         assert len(telemetry.find("foo")) == 2
         assert len(telemetry.find("bar")) == 1
 
+    def test_inmemory_evicts_oldest(self):
+        sink = InMemoryTelemetry(max_events=2)
+        sink.emit({"event": "foo", "estimated_cost_avoided": 0.04})
+        sink.emit({"event": "bar", "estimated_cost_avoided": 0.08})
+        sink.emit({"event": "foo"})
+        assert [e["event"] for e in sink.events] == ["bar", "foo"]
+        assert len(sink.find("foo")) == 1
+        assert sink.cost_saved == pytest.approx(0.08)
+        assert list(sink.costs) == [0.08]
+        sink.emit({"event": "baz"})
+        assert sink.cost_saved == 0.0
+
+    def test_logging_telemetry_respects_level(self, caplog):
+        sink = LoggingTelemetry(logger_name="aura_guard.test", level=logging.DEBUG)
+        with caplog.at_level(logging.INFO, logger="aura_guard.test"):
+            sink.emit({"event": "hidden"})
+        with caplog.at_level(logging.DEBUG, logger="aura_guard.test"):
+            sink.emit({"event": "shown"})
+        assert [r.getMessage() for r in caplog.records] == ["{'event': 'shown'}"]
+
+    def test_inmemory_keeps_event_with_non_numeric_cost(self):
+        sink = InMemoryTelemetry(max_events=2)
+        sink.emit({"event": "foo", "estimated_cost_avoided": "n/a"})
+        sink.emit({"event": "bar", "estimated_cost_avoided": 0.04})
+        assert len(sink.events) == 2
+        assert sink.cost_saved == 0.04
+        sink.emit({"event": "baz"})  # evicts the non-numeric event
+        assert list(sink.costs) == [0.04]
+        assert sink.cost_saved == 0.04
+
+    def test_inmemory_events_is_a_list(self):
+        sink = InMemoryTelemetry([{"event": "foo"}, {"event": "bar"}])
+        assert sink.events == [{"event": "foo"}, {"event": "bar"}]
+        assert sink.events[0:1] == [{"event": "foo"}]
+
+    def test_inmemory_events_mutation_raises(self):
+        sink = InMemoryTelemetry([{"event": "foo"}])
+        with pytest.raises(TypeError, match="read-only snapshot"):
+            sink.events.clear()
+        with pytest.raises(TypeError, match="read-only snapshot"):
+            sink.events.append({"event": "bar"})
+        assert sink.find("foo") == [{"event": "foo"}]
+
+    def test_inmemory_sinks_compare_by_events(self):
+        assert InMemoryTelemetry([{"event": "foo"}]) == InMemoryTelemetry([{"event": "foo"}])
+        assert InMemoryTelemetry([{"event": "foo"}]) != InMemoryTelemetry()
+
+    def test_inmemory_rejects_non_positive_max_events(self):
+        with pytest.raises(ValueError, match="max_events must be >= 1"):
+            InMemoryTelemetry(max_events=0)
+
+    def test_composite_disabled_skips_sinks(self, telemetry):
+        composite = CompositeTelemetry().add(telemetry)
+        composite.emit({"event": "foo"})
+        composite.disabled = True
+        composite.emit({"event": "bar"})
+        assert [e["event"] for e in telemetry.events] == ["foo"]
+
+    def test_webhook_batches_events(self, webhook_server):
+        url, bodies = webhook_server
+        sink = WebhookTelemetry(url=url, flush_interval=60.0)
+        for i in range(3):
+            sink.emit({"event": "foo", "n": i})
+        assert sink.flush(timeout=5)
+        assert len(bodies) == 1
+        assert [e["n"] for e in bodies[0]] == [0, 1, 2]
+        assert all("timestamp" in e for e in bodies[0])
+
+    @pytest.mark.parametrize("webhook_server", [True], indirect=True)
+    def test_webhook_reconnects_stale_connection(self, webhook_server):
+        url, bodies = webhook_server
+        sink = WebhookTelemetry(url=url, flush_interval=60.0)
+        sink.emit({"event": "foo"})
+        assert sink.flush(timeout=5)
+        sink.emit({"event": "bar"})
+        assert sink.flush(timeout=5)
+        assert [b[0]["event"] for b in bodies] == ["foo", "bar"]
+
+    def test_webhook_rejects_invalid_url(self):
+        with pytest.raises(ValueError):
+            WebhookTelemetry(url="ftp://example.com/hook")
+
+    def test_slack_webhook_batches_messages(self, webhook_server):
+        url, bodies = webhook_server
+        sink = SlackWebhookTelemetry(webhook_url=url, channel="#alerts", flush_interval=60.0)
+        sink.emit({"event": "identical_toolcall_loop_block", "tool": "search_kb"})
+        sink.emit({"event": "budget_warning", "estimated_cost_avoided": 0.04})
+        assert sink.flush(timeout=5)
+        assert len(bodies) == 1
+        assert bodies[0]["channel"] == "#alerts"
+        assert "Tool: `search_kb`" in bodies[0]["text"]
+        assert "Cost avoided: $0.0400" in bodies[0]["text"]
+
+    def test_webhook_coalesces_duplicates(self, webhook_server):
+        url, bodies = webhook_server
+        sink = WebhookTelemetry(url=url, flush_interval=60.0, coalesce=True)
+        for _ in range(3):
+            sink.emit({"event": "identical_toolcall_loop_block", "tool": "search_kb",
+                       "estimated_cost_avoided": 0.04})
+        sink.emit({"event": "identical_toolcall_loop_block", "tool": "get_order"})
+        for _ in range(3):
+            sink.emit({"event": "budget_warning", "tool": "refund", "estimated_cost_avoided": "n/a"})
+        assert sink.flush(timeout=5)
+        events = bodies[0]["events"]
+        assert [(e["tool"], e["occurrences"]) for e in events] == [
+            ("search_kb", 3), ("get_order", 1), ("refund", 3),
+        ]
+        assert events[0]["estimated_cost_avoided"] == pytest.approx(0.12)
+        assert events[2]["estimated_cost_avoided"] == "n/a"
+
+    def test_slack_coalesced_message_shows_count(self):
+        body = json.loads(SlackWebhookTelemetry._encode_messages(
+            [{"event": "budget_warning"}] * 2,
+            body_suffix=b"}", coalesce=True, dedup_key=_default_dedup_key,
+        ))
+        assert body == {"text": "⚠️ *Aura Guard* — `budget_warning` ×2"}
+
+    def test_coalescing_keeps_guard_count_field(self):
+        sink = InMemoryTelemetry()
+        g = AuraGuard(
+            config=AuraGuardConfig(secret_key=b"k", max_calls_per_tool=2),
+            telemetry=Telemetry(sink=sink),
+        )
+        s = g.new_state()
+        for i in range(4):
+            call = ToolCall(name="get_order", args={"order_id": f"o{i}"})
+            if g.on_tool_call_request(state=s, call=call).action == PolicyAction.ALLOW:
+                g.on_tool_result(state=s, call=call, result=ToolResult(ok=True))
+        quarantine = sink.find("tool_call_cap_quarantine")
+        assert quarantine and quarantine[0]["count"] == 2
+
+        text = json.loads(SlackWebhookTelemetry._encode_messages(
+            quarantine, body_suffix=b"}", coalesce=False, dedup_key=_default_dedup_key,
+        ))["text"]
+        assert "×" not in text
+
+        merged = json.loads(_encode_webhook_batch(
+            quarantine * 2, coalesce=True, dedup_key=_default_dedup_key,
+        ))["events"]
+        assert merged[0]["count"] == 2
+        assert merged[0]["occurrences"] == 2
+
+    def test_webhook_sinks_copy_and_pickle(self, webhook_server):
+        import copy
+        import pickle
+
+        url, bodies = webhook_server
+        for sink in (WebhookTelemetry(url=url, flush_interval=60.0),
+                     SlackWebhookTelemetry(webhook_url=url, flush_interval=60.0)):
+            sink.emit({"event": "budget_warning"})
+            for clone in (copy.deepcopy(sink), pickle.loads(pickle.dumps(sink))):
+                assert clone == sink
+                clone.emit({"event": "budget_warning"})
+                assert clone.flush(timeout=5)
+                clone.close()
+            assert sink.flush(timeout=5)
+            sink.close()
+        assert len(bodies) == 6
+
+    def test_slack_payload_without_channel(self):
+        body = json.loads(SlackWebhookTelemetry._encode_messages(
+            [{"event": "budget_warning", "reason": "80% of budget"}],
+            body_suffix=b"}", coalesce=False, dedup_key=_default_dedup_key,
+        ))
+        assert body == {"text": "⚠️ *Aura Guard* — `budget_warning`\nReason: 80% of budget"}
+
+    def test_async_webhook_requires_httpx(self, monkeypatch):
+        from aura_guard import AsyncWebhookTelemetry
+        monkeypatch.setitem(sys.modules, "httpx", None)
+        with pytest.raises(ImportError, match="aura-guard\\[httpx\\]"):
+            AsyncWebhookTelemetry(url="http://127.0.0.1:9/hook")
+
+    def test_async_webhook_without_loop_drops_event(self):
+        pytest.importorskip("httpx")
+        from aura_guard import AsyncWebhookTelemetry
+        sink = AsyncWebhookTelemetry(url="http://127.0.0.1:9/hook")
+        sink.emit({"event": "foo"})  # no running loop: dropped, never raises
+        assert not sink._tasks
+
+    def test_async_webhook_posts_from_loop(self, webhook_server):
+        pytest.importorskip("httpx")
+        import asyncio
+        from aura_guard import AsyncWebhookTelemetry
+
+        url, bodies = webhook_server
+
+        async def _run():
+            sink = AsyncWebhookTelemetry(url=url)
+            sink.emit({"event": "foo"})
+            sink.emit({"event": "bar"})
+            await sink.aclose()
+
+        asyncio.run(_run())
+        assert sorted(b["event"] for b in bodies) == ["bar", "foo"]
+
+    def test_async_webhook_closes_client_of_previous_loop(self, webhook_server):
+        pytest.importorskip("httpx")
+        import asyncio
+        from aura_guard import AsyncWebhookTelemetry
+
+        url, bodies = webhook_server
+        sink = AsyncWebhookTelemetry(url=url)
+        clients = []
+
+        async def _send(close):
+            sink.emit({"event": "foo"})
+            await asyncio.gather(*sink._tasks)
+            clients.append(sink._client)
+            if close:
+                await sink.aclose()
+
+        asyncio.run(_send(close=False))
+        asyncio.run(_send(close=True))
+        assert clients[0] is not clients[1]
+        assert clients[0].is_closed
+        assert len(bodies) == 2
+
+    def test_webhook_close_drains_and_stops_thread(self, webhook_server):
+        url, bodies = webhook_server
+        sink = WebhookTelemetry(url=url, flush_interval=60.0)
+        sink.emit({"event": "foo"})
+        thread = sink._worker._thread
+        sink.close(timeout=5)
+        assert not thread.is_alive()
+        assert [e["event"] for e in bodies[0]] == ["foo"]
+
+    def test_collected_webhook_sink_stops_thread(self):
+        import gc
+
+        sink = WebhookTelemetry(url="http://127.0.0.1:9/hook", flush_interval=60.0)
+        sink.emit({"event": "foo"})
+        thread = sink._worker._thread
+        del sink
+        gc.collect()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+
+    def test_slack_bad_event_drops_only_itself(self, webhook_server):
+        url, bodies = webhook_server
+        sink = SlackWebhookTelemetry(webhook_url=url, flush_interval=60.0)
+        sink.emit({"event": "budget_warning", "estimated_cost_avoided": "n/a"})
+        sink.emit({"event": "budget_warning", "tool": "search_kb"})
+        assert sink.flush(timeout=5)
+        assert "Tool: `search_kb`" in bodies[0]["text"]
+        assert "n/a" not in bodies[0]["text"]
+
+    def test_webhook_unreachable_does_not_raise(self):
+        sink = WebhookTelemetry(url="http://127.0.0.1:9/hook", timeout_seconds=0.2)
+        sink.emit({"event": "foo"})
+        assert sink.flush(timeout=10)
+
 
 # ─────────────────────────────────────
 # OpenAI Adapter
@@ -700,3 +1008,24 @@ class TestDefaultKeyWarning:
             AuraGuard(config=AuraGuardConfig(secret_key=b"my-production-key"))
             key_warnings = [x for x in w if "default development secret_key" in str(x.message)]
             assert len(key_warnings) == 0
+
+    def test_bytearray_key_signs_like_bytes(self):
+        calls = []
+        for key in (b"my-production-key", bytearray(b"my-production-key")):
+            g = AuraGuard(config=AuraGuardConfig(secret_key=key))
+            call = ToolCall(name="refund", args={"order_id": "o1"}, ticket_id="t1")
+            g.on_tool_call_request(state=g.new_state(), call=call)
+            calls.append(call.idempotency_key)
+        assert calls[0] is not None and calls[0] == calls[1]
+
+    def test_guard_copies_and_pickles_after_signing(self):
+        import copy
+        import pickle
+
+        g = AuraGuard(config=AuraGuardConfig(secret_key=b"my-production-key"))
+        first = ToolCall(name="refund", args={"order_id": "o1"}, ticket_id="t1")
+        g.on_tool_call_request(state=g.new_state(), call=first)
+        for clone in (copy.deepcopy(g), pickle.loads(pickle.dumps(g))):
+            call = ToolCall(name="refund", args={"order_id": "o1"}, ticket_id="t1")
+            clone.on_tool_call_request(state=clone.new_state(), call=call)
+            assert call.idempotency_key == first.idempotency_key